@@ -1,9 +1,10 @@
 import logging
 import re
 import time
+from dataclasses import dataclass
 
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 from playwright.sync_api import TimeoutError as PwTimeoutError
 from playwright.sync_api import expect, sync_playwright
 
@@ -16,9 +17,47 @@ EXPECTED_UEA_FIRST_TITLE = (
     "FPFtech e UEA vencem e fazem de Manaus a sede da 36ª Conferência Anprotec em 2026"
 )
 
-RE_SPACES = re.compile(r"\s+")
 RE_NOTICIAS = re.compile(r"not[ií]cias", re.I)
 RE_CASES = re.compile(r"cases\s+de\s+sucesso", re.I)
+RE_CASES_URL = re.compile(r".*/cases-de-sucesso/?")
+RE_LOAD_MORE = re.compile(r"carregar\s+mais", re.I)
+RE_FALE = re.compile(r"fale\s+com\s+a\s+gente", re.I)
+RE_FALE_FPF = re.compile(r"fale\s+com\s+a\s+fpftech", re.I)
+RE_ENVIAR = re.compile(r"enviar", re.I)
+RE_CAROUSEL_TEXT = re.compile(
+    r"Educação|Gestão\s+corporativa|Compromisso\s+social|Tecnologias\s+assistivas",
+    re.I,
+)
+RE_SWIPER_INIT = re.compile(r"swiper-initialized")
+RE_BLOG_URL = re.compile(r".*/blog/?")
+RE_EMAIL = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.I)
+RE_PHONE = re.compile(r"(?:\+\s*\d{1,3}\s*)?\(?\d{2}\)?\s*\d{4,5}\s*\d{4}")
+
+# Blocked at the network layer via CDP so Chromium's HTTP cache stays enabled.
+BLOCKED_URL_PATTERNS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.svg*",
+    "*.ico*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*.mp4*",
+    "*.webm*",
+    "*.mp3*",
+    "*.ogg*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+]
 
 # ============================
 # Logger
@@ -40,14 +79,24 @@ class FPFLogger:
 
     def __init__(self, test_id: str) -> None:
         self.test_id = test_id
-        self.logger = self._configure_logger()
+        self.logger = _LOGGER
 
-    def log(self, message: str, level: str = "info") -> None:
+    def _emitter(self, level: str):
         lvl = (level or "info").lower()
         prefix = f"[FPF POC][{self.test_id}][{lvl.upper()}] "
-        fn = getattr(self.logger, lvl, self.logger.info)
+        return getattr(self.logger, lvl, self.logger.info), prefix
+
+    def log(self, message: str, level: str = "info") -> None:
+        fn, prefix = self._emitter(level)
         fn(prefix + message)
 
+    def log_many(self, lines: list[str], level: str = "info") -> None:
+        fn, prefix = self._emitter(level)
+        fn("\n".join(prefix + line for line in lines))
+
+
+_LOGGER = FPFLogger._configure_logger()
+
 
 @pytest.fixture
 def tlog(request) -> FPFLogger:
@@ -89,14 +138,27 @@ def browser(pw, request):
         b.close()
 
 
+@pytest.fixture(scope="session")
+def context(browser):
+    ctx = browser.new_context(viewport={"width": 1920, "height": 1080})
+    try:
+        yield ctx
+    finally:
+        ctx.close()
+
+
 @pytest.fixture
-def page(browser) -> Page:  # type: ignore
-    context = browser.new_context(viewport={"width": 1920, "height": 1080})
+def page(context) -> Page:  # type: ignore
     p = context.new_page()
+    cdp = context.new_cdp_session(p)
+    cdp.send("Network.enable")
+    cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     try:
         yield p
     finally:
-        context.close()
+        cdp.detach()
+        p.close()
+        context.clear_cookies()
 
 
 # ============================
@@ -105,7 +167,7 @@ def page(browser) -> Page:  # type: ignore
 
 
 def norm(s: str) -> str:
-    return RE_SPACES.sub(" ", (s or "").strip())
+    return " ".join(s.split()) if s else ""
 
 
 def goto(page: Page, url: str, *, wait: str = "domcontentloaded") -> None:
@@ -152,7 +214,7 @@ def open_cases_page(page: Page) -> None:
                 link.click(timeout=2500, force=True, no_wait_after=True)
 
             try:
-                page.wait_for_url(re.compile(r".*/cases-de-sucesso/?"), timeout=8000)
+                page.wait_for_url(RE_CASES_URL, timeout=8000)
             except Exception:
                 goto(page, CASES_URL, wait="domcontentloaded")
 
@@ -177,40 +239,37 @@ def pick_selectors(page: Page) -> tuple[str, str]:
         ".elementor-post__title",
         "article h3",
     ]
-    card_sel = next(
-        (s for s in card_candidates if page.locator(s).count() > 0), "article"
-    )
-    title_sel = next(
-        (s for s in title_candidates if page.locator(s).count() > 0), "article h3"
+    card_sel, title_sel = page.evaluate(
+        "(groups) => groups.map((g) => g.find((s) => document.querySelector(s)) || null)",
+        [card_candidates, title_candidates],
     )
-    return card_sel, title_sel
+    return card_sel or "article", title_sel or "article h3"
 
 
 def click_load_more_until_end(
     page: Page, card_selector: str, max_clicks: int = 50
 ) -> None:
-    load_more = page.get_by_role("button", name=re.compile(r"carregar\s+mais", re.I))
+    load_more = page.get_by_role("button", name=RE_LOAD_MORE)
 
     for _ in range(max_clicks):
         page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        page.wait_for_timeout(500)
 
         try:
-            if not load_more.is_visible(timeout=1500):
-                return
+            load_more.wait_for(state="visible", timeout=1500)
         except Exception:
             return
 
         prev = page.locator(card_selector).count()
         load_more.scroll_into_view_if_needed()
         load_more.click()
-        page.wait_for_load_state("networkidle")
 
-        for _ in range(32):  # ~8s
-            page.wait_for_timeout(250)
-            if page.locator(card_selector).count() > prev:
-                break
-        else:
+        try:
+            page.wait_for_function(
+                "([sel, prev]) => document.querySelectorAll(sel).length > prev",
+                arg=[card_selector, prev],
+                timeout=8000,
+            )
+        except PwTimeoutError:
             return
 
 
@@ -228,11 +287,14 @@ def extract_case_titles(page: Page, title_selector: str) -> list[str]:
 
 
 def log_titles(tlog: FPFLogger, titles: list[str]) -> None:
-    tlog.log("===== CASES =====")
-    for i, title in enumerate(titles, start=1):
-        tlog.log(f"{i:04d} | {title}")
-    tlog.log("=====================================")
-    tlog.log(f"TOTAL: {len(titles)}")
+    tlog.log_many(
+        [
+            "===== CASES =====",
+            *(f"{i:04d} | {title}" for i, title in enumerate(titles, start=1)),
+            "=====================================",
+            f"TOTAL: {len(titles)}",
+        ]
+    )
 
 
 # ============================
@@ -243,11 +305,7 @@ def log_titles(tlog: FPFLogger, titles: list[str]) -> None:
 def open_contact_page_via_fale_com_a_gente(page: Page) -> None:
     goto(page, HOME_URL)
 
-    btn_talk = (
-        page.locator("a[href*='/contato/']")
-        .filter(has_text=re.compile(r"fale\s+com\s+a\s+gente", re.I))
-        .first
-    )
+    btn_talk = page.locator("a[href*='/contato/']").filter(has_text=RE_FALE).first
 
     if btn_talk.count() > 0:
         try:
@@ -260,9 +318,7 @@ def open_contact_page_via_fale_com_a_gente(page: Page) -> None:
     else:
         page.goto(CONTACT_URL, wait_until="networkidle")
 
-    expect(
-        page.get_by_role("heading", name=re.compile(r"fale\s+com\s+a\s+fpftech", re.I))
-    ).to_be_visible(timeout=15000)
+    expect(page.get_by_role("heading", name=RE_FALE_FPF)).to_be_visible(timeout=15000)
 
 
 def fill_contact_form_without_submit(
@@ -283,9 +339,36 @@ def fill_contact_form_without_submit(
     ).first
     msg.fill(mensagem)
 
-    expect(page.get_by_role("button", name=re.compile(r"enviar", re.I))).to_be_visible(
-        timeout=15000
-    )
+    expect(page.get_by_role("button", name=RE_ENVIAR)).to_be_visible(timeout=15000)
+
+
+CONTACT_SECTIONS_JS = """
+(labels) => {
+    const lookups = [
+        "ancestor::*[contains(@class,'e-con')][1]",
+        "ancestor::*[contains(@class,'elementor-element')][1]",
+        "following::p[1]",
+    ];
+    const headings = Array.from(document.querySelectorAll("h1,h2,h3,h4,h5,h6"));
+
+    return labels.map((label) => {
+        const needle = label.replace(/\\s+/g, " ").toLowerCase();
+        const h = headings.find((el) =>
+            el.textContent.replace(/\\s+/g, " ").toLowerCase().includes(needle)
+        );
+        if (!h) return "";
+
+        for (const xp of lookups) {
+            const node = document.evaluate(
+                xp, h, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            const txt = node ? node.innerText.trim() : "";
+            if (txt) return txt;
+        }
+        return "";
+    });
+}
+"""
 
 
 def extract_contact_info_from_sections(page: Page) -> dict:
@@ -294,41 +377,18 @@ def extract_contact_info_from_sections(page: Page) -> dict:
 
     expect(h_onde).to_be_visible(timeout=20000)
     h_onde.scroll_into_view_if_needed()
-    page.wait_for_timeout(300)
     expect(h_cont).to_be_visible(timeout=20000)
 
-    def container_text(h) -> str:
-        for xp in [
-            "xpath=ancestor::*[contains(@class,'e-con')][1]",
-            "xpath=ancestor::*[contains(@class,'elementor-element')][1]",
-        ]:
-            loc = h.locator(xp)
-            if loc.count() > 0:
-                try:
-                    txt = loc.inner_text().strip()
-                    if txt:
-                        return txt
-                except Exception:
-                    pass
-
-        p = h.locator("xpath=following::p[1]")
-        if p.count() > 0:
-            try:
-                return p.inner_text().strip()
-            except Exception:
-                pass
-        return ""
-
-    onde_text = container_text(h_onde)
-    cont_text = container_text(h_cont)
+    onde_text, cont_text = page.evaluate(
+        CONTACT_SECTIONS_JS, ["Onde estamos", "Contatos"]
+    )
     combined = f"{onde_text}\n{cont_text}"
 
-    emails = sorted(
-        set(re.findall(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", combined, flags=re.I))
-    )
-    phones = sorted(
-        set(re.findall(r"(?:\+\s*\d{1,3}\s*)?\(?\d{2}\)?\s*\d{4,5}\s*\d{4}", combined))
-    )
+    seen_emails: dict[str, str] = {}
+    for m in RE_EMAIL.finditer(combined):
+        seen_emails.setdefault(m.group(0).lower(), m.group(0))
+    emails = list(seen_emails.values())
+    phones = list(dict.fromkeys(RE_PHONE.findall(combined)))
 
     address = None
     for ln in [x.strip() for x in onde_text.splitlines() if x.strip()]:
@@ -376,30 +436,21 @@ def log_contact_info(tlog: FPFLogger, info: dict) -> None:
 
 def open_home_page(page: Page) -> None:
     goto(page, HOME_URL, wait="domcontentloaded")
-    page.wait_for_load_state("networkidle")
-
-    page.mouse.wheel(0, 700)
-    page.wait_for_timeout(350)
+    page.wait_for_selector(
+        ".e-n-carousel.swiper-initialized", state="attached", timeout=15000
+    )
+    page.evaluate("window.scrollTo(0, 700)")
 
 
 def _get_main_carousel(page: Page):
-    carousel = page.locator(
-        ".e-n-carousel",
-        has_text=re.compile(
-            r"Educação|Gestão\s+corporativa|Compromisso\s+social|Tecnologias\s+assistivas",
-            re.I,
-        ),
-    ).first
+    carousel = page.locator(".e-n-carousel", has_text=RE_CAROUSEL_TEXT).first
 
-    expect(carousel).to_have_count(1, timeout=20000)
+    expect(carousel).to_have_class(RE_SWIPER_INIT, timeout=20000)
     carousel.scroll_into_view_if_needed()
-    page.wait_for_timeout(300)
-    expect(carousel).to_have_class(re.compile(r"swiper-initialized"), timeout=20000)
     return carousel
 
 
-def _get_carousel_widget_scope(page: Page):
-    carousel = _get_main_carousel(page)
+def _get_carousel_widget_scope(carousel):
     scope = carousel.locator(
         "xpath=ancestor::*[contains(@class,'elementor-widget-container')][1]"
     )
@@ -411,20 +462,47 @@ def _get_carousel_widget_scope(page: Page):
     return scope
 
 
+@dataclass(frozen=True)
+class _CarouselCtx:
+    carousel: Locator
+    scope: Locator
+    next_btn: Locator
+
+
+def _get_carousel_ctx(carousel) -> _CarouselCtx:
+    scope = _get_carousel_widget_scope(carousel)
+    return _CarouselCtx(
+        carousel=carousel,
+        scope=scope,
+        next_btn=scope.locator(".elementor-swiper-button-next").first,
+    )
+
+
+SLIDE_TITLE_JS = """
+(el) => {
+    const h = el.querySelector("h2, h3, h4");
+    return h ? h.textContent.trim() : "";
+}
+"""
+
+SLIDE_DESCRIPTION_JS = """
+(el) => Array.from(el.querySelectorAll("p"), (p) => p.textContent.trim())
+    .filter(Boolean)
+    .join(" ")
+"""
+
+
 def _extract_slide_text(slide) -> dict:
     title = ""
     desc = ""
 
-    h = slide.locator("h2, h3, h4").first
-    if h.count() > 0:
-        try:
-            title = norm(h.inner_text())
-        except Exception:
-            pass
+    try:
+        title = norm(slide.evaluate(SLIDE_TITLE_JS))
+    except Exception:
+        pass
 
     try:
-        ps = slide.locator("p").all_inner_texts()
-        desc = " ".join(norm(x) for x in ps if norm(x))
+        desc = norm(slide.evaluate(SLIDE_DESCRIPTION_JS))
     except Exception:
         desc = ""
 
@@ -437,58 +515,138 @@ def _extract_slide_text(slide) -> dict:
     return {"title": title, "description": desc, "raw": ""}
 
 
-def get_active_carousel_block_info(page: Page) -> dict:
-    carousel = _get_main_carousel(page)
-
-    slide = carousel.locator(".swiper-slide:not([aria-hidden='true'])").first
-    if slide.count() == 0:
-        slide = carousel.locator(".swiper-slide-active").first
-    if slide.count() == 0:
-        slide = carousel.locator(".swiper-slide").first
+CAROUSEL_TITLES_JS = """
+(carousel) => {
+    const source = carousel.swiper
+        ? carousel.swiper.slides
+        : carousel.querySelectorAll(".swiper-slide");
+    const titles = {};
+    Array.from(source).forEach((slide, i) => {
+        if (slide.classList.contains("swiper-slide-duplicate")) return;
+        const idx = slide.getAttribute("data-swiper-slide-index") ?? String(i);
+        if (idx in titles) return;
+
+        const h = slide.querySelector("h2, h3, h4");
+        titles[idx] = h ? h.textContent.trim() : "";
+    });
+    return Object.values(titles);
+}
+"""
+
+
+def _extract_all_slide_titles(carousel) -> list[str]:
+    return [norm(t) for t in carousel.evaluate(CAROUSEL_TITLES_JS)]
+
+
+ACTIVE_SLIDE_KEY_JS = """
+(carousel) => {
+    const active = carousel.querySelector(".swiper-slide-active");
+    if (!active) return "";
+    return (
+        active.getAttribute("data-swiper-slide-index") ??
+        String(Array.prototype.indexOf.call(active.parentElement.children, active))
+    );
+}
+"""
+
+
+SLIDE_CHANGED_JS = """
+([carousel, prev]) => {
+    const active = carousel.querySelector(".swiper-slide-active");
+    if (!active) return false;
+    const key =
+        active.getAttribute("data-swiper-slide-index") ??
+        String(Array.prototype.indexOf.call(active.parentElement.children, active));
+    return key !== prev;
+}
+"""
+
+
+ACTIVE_SLIDE_SELECTORS = [
+    ".swiper-slide:not([aria-hidden='true'])",
+    ".swiper-slide-active",
+    ".swiper-slide",
+]
+
+
+def _active_slide_info(carousel) -> dict:
+    sel = carousel.evaluate(
+        "(c, sels) => sels.find((s) => c.querySelector(s)) || sels[sels.length - 1]",
+        ACTIVE_SLIDE_SELECTORS,
+    )
+    slide = carousel.locator(sel).first
 
     expect(slide).to_be_visible(timeout=20000)
     return _extract_slide_text(slide)
 
 
-def carousel_next(page: Page) -> None:
-    scope = _get_carousel_widget_scope(page)
-    btn = scope.locator(".elementor-swiper-button-next").first
-    btn.scroll_into_view_if_needed()
-    btn.click()
+def _carousel_step(ctx: _CarouselCtx, prev: str) -> None:
+    ctx.next_btn.scroll_into_view_if_needed()
+    ctx.next_btn.click()
 
+    handle = ctx.carousel.element_handle(timeout=3000)
+    try:
+        ctx.carousel.page.wait_for_function(
+            SLIDE_CHANGED_JS, arg=[handle, prev], polling="raf", timeout=3000
+        )
+    except PwTimeoutError:
+        pass
+    finally:
+        handle.dispose()
 
-def collect_all_carousel_titles_via_next(page: Page, max_steps: int = 25) -> list[str]:
-    _get_main_carousel(page)
 
-    titles: list[str] = []
-    seen: set[str] = set()
+def get_active_carousel_block_info(page: Page, carousel=None) -> dict:
+    if carousel is None:
+        carousel = _get_main_carousel(page)
+    return _active_slide_info(carousel)
 
-    cur = get_active_carousel_block_info(page).get("title", "").strip()
-    if cur:
-        titles.append(cur)
-        seen.add(cur)
 
-    for _ in range(max_steps):
-        carousel_next(page)
-        page.wait_for_timeout(650)
+def carousel_next(page: Page, carousel=None) -> None:
+    if carousel is None:
+        carousel = _get_main_carousel(page)
+    _carousel_step(_get_carousel_ctx(carousel), carousel.evaluate(ACTIVE_SLIDE_KEY_JS))
+
+
+def collect_all_carousel_titles(page: Page) -> list[str]:
+    carousel = _get_main_carousel(page)
+    titles = [t for t in _extract_all_slide_titles(carousel) if t]
+    return list(dict.fromkeys(titles))
+
+
+def collect_all_carousel_titles_via_next(
+    page: Page, max_steps: int = 25, carousel=None
+) -> list[str]:
+    if carousel is None:
+        carousel = _get_main_carousel(page)
+    ctx = _get_carousel_ctx(carousel)
 
-        t = get_active_carousel_block_info(page).get("title", "").strip()
-        if not t:
-            continue
-        if t in seen:
+    titles: list[str] = []
+    seen_idx: set[str] = set()
+
+    for _ in range(max_steps):
+        idx = ctx.carousel.evaluate(ACTIVE_SLIDE_KEY_JS)
+        if idx in seen_idx:
             break
-        titles.append(t)
-        seen.add(t)
+        seen_idx.add(idx)
 
-    return titles
+        t = _active_slide_info(ctx.carousel).get("title", "").strip()
+        if t:
+            titles.append(t)
+
+        _carousel_step(ctx, idx)
+
+    return list(dict.fromkeys(titles))
 
 
 def log_carousel_titles(tlog: FPFLogger, titles: list[str]) -> None:
-    tlog.log("===== HOME CARROSSEL =====")
-    for i, t in enumerate(titles, start=1):
-        tlog.log(f"{i:04d} | {t}")
-    tlog.log("========================================")
-    tlog.log(f"TOTAL: {len(titles)}")
+    tlog.log_many(
+        [
+            "===== HOME CARROSSEL =====",
+            *(f"{i:04d} | {t}" for i, t in enumerate(titles, start=1)),
+            "========================================",
+            f"TOTAL: {len(titles)}",
+        ]
+    )
 
 
 # ============================
@@ -497,78 +655,90 @@ def log_carousel_titles(tlog: FPFLogger, titles: list[str]) -> None:
 
 
 def open_news_page_via_menu(page: Page) -> None:
+    if RE_BLOG_URL.fullmatch(page.url):
+        return
+
     if page.url == "about:blank" or "fpftech.com" not in page.url:
         goto(page, HOME_URL)
 
-    page.evaluate("window.scrollTo(0, 0)")
-    page.wait_for_timeout(150)
-
-    noticias = page.locator("a[href*='/blog']").filter(has_text=RE_NOTICIAS).first
+    noticias = (
+        page.get_by_role("link", name=RE_NOTICIAS)
+        .and_(page.locator("a[href*='/blog']"))
+        .first
+    )
     if noticias.count() == 0:
         page.goto(BLOG_URL, wait_until="domcontentloaded")
     else:
+        page.evaluate("window.scrollTo(0, 0)")
         click_or_goto(noticias, BLOG_URL, page)
 
-    expect(page).to_have_url(re.compile(r".*/blog/?"), timeout=20000)
+    expect(page).to_have_url(RE_BLOG_URL, timeout=20000)
 
 
 def _get_news_search_input(page: Page):
     container = page.locator("div.asl_w_container").first
     expect(container).to_be_visible(timeout=20000)
 
-    inp = container.locator(
-        "input[type='search'], input[type='text'], input.asl_text, input.asl-search"
-    ).first
+    inp = container.get_by_role("searchbox").or_(container.get_by_role("textbox")).first
     expect(inp).to_be_visible(timeout=20000)
     return inp
 
 
+NEWS_TEXTS_JS = """
+(selector) => Array.from(
+    document.querySelectorAll(selector),
+    (el) => el.textContent.replace(/\\s+/g, " ").trim()
+).filter((t) => t.length > 3)
+"""
+
+
 def search_news_and_collect_titles(page: Page, query: str) -> list[str]:
     search_input = _get_news_search_input(page)
     search_input.click()
     search_input.fill(query)
     search_input.press("Enter")
 
-    results_box = page.locator("div.asl_results").first
+    first_result = page.locator(
+        "div.asl_results .asl_r, div.asl_results .asl_nores"
+    ).first
     try:
-        results_box.wait_for(state="visible", timeout=2500)
-        raw = page.locator(
-            "div.asl_results div.asl_r h3, "
-            "div.asl_results div.asl_r a span, "
-            "div.asl_results div.asl_r a"
-        ).all_text_contents()
-        clean = [norm(t) for t in raw if norm(t) and len(norm(t)) > 3]
-        return clean
+        first_result.wait_for(state="visible", timeout=2500)
+        return page.evaluate(
+            NEWS_TEXTS_JS,
+            "div.asl_results div.asl_r h3, div.asl_results div.asl_r a span",
+        )
     except Exception:
         try:
             page.wait_for_load_state("domcontentloaded", timeout=15000)
         except Exception:
             pass
 
-        h1 = page.locator("h1").first
-        if h1.count() > 0:
-            try:
-                t = norm(h1.inner_text())
-                if t:
-                    return [t]
-            except Exception:
-                pass
+        try:
+            t = norm(
+                page.evaluate(
+                    "() => { const h = document.querySelector('h1'); return h ? h.innerText : ''; }"
+                )
+            )
+            if t:
+                return [t]
+        except Exception:
+            pass
 
-        raw = page.locator(
-            "article h2, article h3, .elementor-post__title, .entry-title"
-        ).all_text_contents()
-        clean = [norm(t) for t in raw if norm(t) and len(norm(t)) > 3]
-        return clean
+        return page.evaluate(
+            NEWS_TEXTS_JS,
+            "article h2, article h3, .elementor-post__title, .entry-title",
+        )
 
 
 def log_news_search(tlog: FPFLogger, term: str, titles: list[str]) -> None:
-    tlog.log(f"===== NOTÍCIAS | busca: {term} =====")
-    if not titles:
-        tlog.log("(nenhum resultado)")
-    else:
-        for i, t in enumerate(titles, start=1):
-            tlog.log(f"{i:04d} | {t}")
-    tlog.log("====================================")
+    lines = [f"{i:04d} | {t}" for i, t in enumerate(titles, start=1)]
+    tlog.log_many(
+        [
+            f"===== NOTÍCIAS | busca: {term} =====",
+            *(lines or ["(nenhum resultado)"]),
+            "====================================",
+        ]
+    )
 
 
 def assert_first_news_title_is_uea(page: Page, titles: list[str]) -> None:
@@ -28,7 +28,6 @@ def test_0002(page: Page, tlog):
     )
 
     page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    page.wait_for_timeout(800)
 
     info = extract_contact_info_from_sections(page)
     log_contact_info(tlog, info)
@@ -41,7 +40,7 @@ def test_0002(page: Page, tlog):
 def test_0003(page: Page, tlog):
     open_home_page(page)
 
-    titles = collect_all_carousel_titles_via_next(page, max_steps=25)
+    titles = collect_all_carousel_titles(page)
     log_carousel_titles(tlog, titles)
 
     assert len(titles) > 0, "Não conseguiu coletar títulos do carrossel"
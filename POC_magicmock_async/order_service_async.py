@@ -1,3 +1,16 @@
+import asyncio
+
+
+def _compute_total(items: list[dict]) -> float:
+    """
+    Compute the order total as the sum of price times quantity for every item.
+
+    :parameter items: A list of order items (each item must have price and may have qty).
+    :return: The order total.
+    """
+    return sum([i["price"] * i.get("qty", 1) for i in items])
+
+
 class OrderServiceAsync:
     def __init__(self, gateway, repo, audit):
         """
@@ -5,17 +18,20 @@ class OrderServiceAsync:
 
         :parameter gateway: Async payment client exposing authorize_payment.
         :parameter repo: Async repository exposing save_order.
-        :parameter audit: Async audit/telemetry exposing track.
+        :parameter audit: Async audit/telemetry exposing track(event, **fields).
         :return: None
         """
         self.gateway = gateway
         self.repo = repo
         self.audit = audit
+        self._audit_tasks: set[asyncio.Task] = set()
 
     async def create_order(self, user_id: int, items: list[dict]) -> dict:
         """
         Create an order asynchronously by authorizing payment, saving it, and tracking the outcome.
 
+        The audit event is tracked in the background; await drain() to wait for it.
+
         :parameter user_id: The user identifier who owns the order.
         :parameter items: A list of order items (each item must have price and may have qty).
         :return: A dictionary representing the persisted order.
@@ -23,13 +39,13 @@ class OrderServiceAsync:
         if not items:
             raise ValueError("items cannot be empty")
 
-        total = sum(i["price"] * i.get("qty", 1) for i in items)
+        total = _compute_total(items)
 
         auth = await self.gateway.authorize_payment(user_id=user_id, amount=total)
         status = auth.get("status")
 
         if status != "approved":
-            await self.audit.track("order_denied", {"user_id": user_id, "total": total})
+            self._track_in_background("order_denied", user_id=user_id, total=total)
             raise PermissionError("payment not approved")
 
         order = await self.repo.save_order(
@@ -39,5 +55,26 @@ class OrderServiceAsync:
             payment_id=auth["payment_id"],
         )
 
-        await self.audit.track("order_created", {"order_id": order["id"], "total": total})
+        self._track_in_background("order_created", order_id=order["id"], total=total)
         return order
+
+    async def drain(self) -> None:
+        """
+        Wait until every audit event scheduled by create_order has been tracked.
+
+        :return: None
+        """
+        if self._audit_tasks:
+            await asyncio.gather(*self._audit_tasks)
+
+    def _track_in_background(self, event: str, **fields) -> None:
+        """
+        Schedule an audit event without blocking the caller on the audit round trip.
+
+        :parameter event: The audit event name.
+        :parameter fields: The event fields passed to track as keyword arguments.
+        :return: None
+        """
+        task = asyncio.create_task(self.audit.track(event, **fields))
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, MagicMock, call
 
@@ -5,23 +6,45 @@ from order_service_async import OrderServiceAsync
 
 
 class TestOrderServiceAsync(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare async mocked dependencies shared by every test.
+
+        :parameter cls: The test case class.
+        :return: None
+        """
+        cls.gateway = MagicMock()
+        cls.repo = MagicMock()
+        cls.audit = MagicMock()
+
+        cls.gateway.authorize_payment = AsyncMock()
+        cls.repo.save_order = AsyncMock()
+        cls.audit.track = AsyncMock()
+
     def setUp(self):
         """
-        Prepare async mocked dependencies and instantiate OrderServiceAsync for each test.
+        Reset the shared mocks and instantiate OrderServiceAsync so no audit task outlives its event loop.
 
         :parameter self: The test case instance.
         :return: None
         """
-        self.gateway = MagicMock()
-        self.repo = MagicMock()
-        self.audit = MagicMock()
-
-        self.gateway.authorize_payment = AsyncMock()
-        self.repo.save_order = AsyncMock()
-        self.audit.track = AsyncMock()
+        for mock in (self.gateway, self.repo, self.audit):
+            mock.reset_mock(return_value=True, side_effect=True)
 
         self.service = OrderServiceAsync(self.gateway, self.repo, self.audit)
 
+    async def asyncSetUp(self):
+        """
+        Install the eager task factory so tasks whose awaits resolve immediately skip the ready queue.
+
+        :parameter self: The test case instance.
+        :return: None
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     async def test_success_returns_order_and_calls_dependencies(self):
         """
         Validate the success path by asserting returned order and correct awaited calls.
@@ -35,6 +58,7 @@ class TestOrderServiceAsync(unittest.IsolatedAsyncioTestCase):
         self.repo.save_order.return_value = {"id": 99, "total": 25}
 
         order = await self.service.create_order(user_id=1, items=items)
+        await self.service.drain()
 
         self.assertEqual(order["id"], 99)
 
@@ -45,7 +69,7 @@ class TestOrderServiceAsync(unittest.IsolatedAsyncioTestCase):
             total=25,
             payment_id="pay_123",
         )
-        self.audit.track.assert_awaited_once_with("order_created", {"order_id": 99, "total": 25})
+        self.audit.track.assert_awaited_once_with("order_created", order_id=99, total=25)
 
     async def test_denied_tracks_denied_and_does_not_save(self):
         """
@@ -59,10 +83,11 @@ class TestOrderServiceAsync(unittest.IsolatedAsyncioTestCase):
 
         with self.assertRaises(PermissionError):
             await self.service.create_order(user_id=7, items=items)
+        await self.service.drain()
 
         self.gateway.authorize_payment.assert_awaited_once_with(user_id=7, amount=10)
         self.repo.save_order.assert_not_awaited()
-        self.audit.track.assert_awaited_once_with("order_denied", {"user_id": 7, "total": 10})
+        self.audit.track.assert_awaited_once_with("order_denied", user_id=7, total=10)
 
     async def test_empty_items_raises_and_calls_nothing(self):
         """
@@ -127,15 +152,49 @@ class TestOrderServiceAsync(unittest.IsolatedAsyncioTestCase):
 
         with self.assertRaises(PermissionError):
             await self.service.create_order(user_id=1, items=items)
+        await self.service.drain()
 
         self.repo.save_order.reset_mock()
         self.audit.track.reset_mock()
 
         order = await self.service.create_order(user_id=1, items=items)
+        await self.service.drain()
         self.assertEqual(order["id"], 2)
 
         self.repo.save_order.assert_awaited_once()
-        self.audit.track.assert_awaited_once_with("order_created", {"order_id": 2, "total": 10})
+        self.audit.track.assert_awaited_once_with("order_created", order_id=2, total=10)
+
+    async def test_drain_waits_for_background_audit(self):
+        """
+        Validate that create_order returns without waiting on audit and drain awaits the pending event.
+
+        :parameter self: The test case instance.
+        :return: None
+        """
+        items = [{"price": 5, "qty": 2}]  # total=10
+        self.gateway.authorize_payment.return_value = {"status": "approved", "payment_id": "p3"}
+        self.repo.save_order.return_value = {"id": 3, "total": 10}
+
+        released = asyncio.Event()
+
+        async def slow_track(*args, **kwargs):
+            await released.wait()
+
+        self.audit.track.side_effect = slow_track
+
+        order = await asyncio.wait_for(
+            self.service.create_order(user_id=1, items=items), timeout=1
+        )
+        self.assertEqual(order["id"], 3)
+        self.audit.track.assert_called_once_with("order_created", order_id=3, total=10)
+
+        drain = asyncio.create_task(self.service.drain())
+        await asyncio.sleep(0)
+        self.assertFalse(drain.done())
+
+        released.set()
+        await drain
+        self.audit.track.assert_awaited_once_with("order_created", order_id=3, total=10)
 
 
 if __name__ == "__main__":
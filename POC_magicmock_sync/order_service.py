@@ -1,3 +1,13 @@
+def _compute_total(items: list[dict]) -> float:
+    """
+    Compute the order total as the sum of price times quantity for every item.
+
+    :parameter items: A list of order items (each item must have price and may have qty).
+    :return: The order total.
+    """
+    return sum([i["price"] * i.get("qty", 1) for i in items])
+
+
 class OrderService:
     def __init__(self, gateway, repo, audit):
         """
@@ -5,7 +15,7 @@ class OrderService:
 
         :parameter gateway: Payment client.
         :parameter repo: Repository responsible for persisting orders.
-        :parameter audit: Component exposing track for events.
+        :parameter audit: Component exposing track(event, **fields) for events.
         :return: None
         """
         self.gateway = gateway
@@ -23,13 +33,13 @@ class OrderService:
         if not items:
             raise ValueError("items cannot be empty")
 
-        total = sum(i["price"] * i.get("qty", 1) for i in items)
+        total = _compute_total(items)
 
         auth = self.gateway.authorize_payment(user_id=user_id, amount=total)
         status = auth.get("status")
 
         if status != "approved":
-            self.audit.track("order_denied", {"user_id": user_id, "total": total})
+            self.audit.track("order_denied", user_id=user_id, total=total)
             raise PermissionError("payment not approved")
 
         order = self.repo.save_order(
@@ -39,5 +49,5 @@ class OrderService:
             payment_id=auth["payment_id"],
         )
 
-        self.audit.track("order_created", {"order_id": order["id"], "total": total})
+        self.audit.track("order_created", order_id=order["id"], total=total)
         return order
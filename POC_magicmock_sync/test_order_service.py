@@ -5,17 +5,28 @@ from order_service import OrderService
 
 
 class TestOrderService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare mocked dependencies and instantiate a single OrderService shared by every test.
+
+        :parameter cls: The test case class.
+        :return: None
+        """
+        cls.gateway = MagicMock()
+        cls.repo = MagicMock()
+        cls.audit = MagicMock()
+        cls.service = OrderService(cls.gateway, cls.repo, cls.audit)
+
     def setUp(self):
         """
-        Prepare mocked dependencies and instantiate OrderService for each test.
+        Reset recorded calls, return values and side effects on the shared mocks.
 
         :parameter self: The test case instance.
         :return: None
         """
-        self.gateway = MagicMock()
-        self.repo = MagicMock()
-        self.audit = MagicMock()
-        self.service = OrderService(self.gateway, self.repo, self.audit)
+        for mock in (self.gateway, self.repo, self.audit):
+            mock.reset_mock(return_value=True, side_effect=True)
 
     def test_success_returns_order_and_calls_dependencies(self):
         """
@@ -43,9 +54,7 @@ class TestOrderService(unittest.TestCase):
             total=25,
             payment_id="pay_123",
         )
-        self.audit.track.assert_called_once_with(
-            "order_created", {"order_id": 99, "total": 25}
-        )
+        self.audit.track.assert_called_once_with("order_created", order_id=99, total=25)
 
     def test_denied_tracks_denied_and_does_not_save(self):
         """
@@ -62,9 +71,7 @@ class TestOrderService(unittest.TestCase):
 
         self.gateway.authorize_payment.assert_called_once_with(user_id=7, amount=10)
         self.repo.save_order.assert_not_called()
-        self.audit.track.assert_called_once_with(
-            "order_denied", {"user_id": 7, "total": 10}
-        )
+        self.audit.track.assert_called_once_with("order_denied", user_id=7, total=10)
 
     def test_empty_items_raises_and_calls_nothing(self):
         """
@@ -120,28 +127,35 @@ class TestOrderService(unittest.TestCase):
         """
         Validate global call order: authorize payment, save order, then track success.
 
+        Uses its own mocks because attach_mock re-parents them permanently.
+
         :parameter self: The test case instance.
         :return: None
         """
         items = [{"price": 2, "qty": 2}]  # total=4
-        self.gateway.authorize_payment.return_value = {
+        gateway = MagicMock()
+        repo = MagicMock()
+        audit = MagicMock()
+        service = OrderService(gateway, repo, audit)
+
+        gateway.authorize_payment.return_value = {
             "status": "approved",
             "payment_id": "p1",
         }
-        self.repo.save_order.return_value = {"id": 1, "total": 4}
+        repo.save_order.return_value = {"id": 1, "total": 4}
 
         parent = MagicMock()
-        parent.attach_mock(self.gateway, "gateway")
-        parent.attach_mock(self.repo, "repo")
-        parent.attach_mock(self.audit, "audit")
+        parent.attach_mock(gateway, "gateway")
+        parent.attach_mock(repo, "repo")
+        parent.attach_mock(audit, "audit")
 
-        self.service.create_order(user_id=1, items=items)
+        service.create_order(user_id=1, items=items)
 
         parent.assert_has_calls(
             [
                 call.gateway.authorize_payment(user_id=1, amount=4),
                 call.repo.save_order(user_id=1, items=items, total=4, payment_id="p1"),
-                call.audit.track("order_created", {"order_id": 1, "total": 4}),
+                call.audit.track("order_created", order_id=1, total=4),
             ],
             any_order=False,
         )
@@ -188,9 +202,7 @@ class TestOrderService(unittest.TestCase):
         self.assertEqual(order["id"], 2)
 
         self.repo.save_order.assert_called_once()
-        self.audit.track.assert_called_once_with(
-            "order_created", {"order_id": 2, "total": 10}
-        )
+        self.audit.track.assert_called_once_with("order_created", order_id=2, total=10)
 
 
 if __name__ == "__main__":